@@ -97,9 +97,10 @@ class _ClangBasedTargetInfo(TargetInfo, metaclass=ABCMeta):
         result = ["-target", self.target_triple, "-pipe"]
         # And usually also --sysroot
         if self.project.needs_sysroot:
-            result.append("--sysroot=" + str(self.sysroot_dir))
-            if perform_sanity_checks and self.project.is_nonexistent_or_empty_dir(self.sysroot_dir):
-                self.project.fatal("Project", self.project.target, "needs a sysroot, but", self.sysroot_dir,
+            sysroot_dir = self.sysroot_dir  # only compute the path once
+            result.append("--sysroot=" + str(sysroot_dir))
+            if perform_sanity_checks and self.project.is_nonexistent_or_empty_dir(sysroot_dir):
+                self.project.fatal("Project", self.project.target, "needs a sysroot, but", sysroot_dir,
                                    " is empty or does not exist.")
         result += ["-B" + str(self._compiler_dir)]
 
@@ -29,7 +29,6 @@
 #
 
 import os
-import pprint
 import typing
 from pathlib import Path
 
@@ -75,8 +74,9 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
 
     def __init__(self, config: CheriConfig):
         super().__init__(config)
-        buildhost = self.get_host_triple()
         if not self.compiling_for_host() and self.add_host_target_build_config_options:
+            # Only query the host compiler if we actually need the triple (native builds don't pass --build=)
+            buildhost = self.get_host_triple()
             autotools_triple = self.target_info.target_triple
             # Most scripts don't like the final -purecap component:
             autotools_triple = autotools_triple.replace("-purecap", "")
@@ -91,8 +91,9 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
 
     def add_configure_env_arg(self, arg: str, value: "typing.Union[str,Path]"):
         super().add_configure_env_arg(arg, value)
-        if self._configure_supports_variables_on_cmdline:
-            self.configure_args.append(arg + "=" + str(value))
+        if self._configure_supports_variables_on_cmdline and value is not None:
+            # Reuse the string that was stored in configure_environment instead of converting the value again
+            self.configure_args.append("{}={}".format(arg, self.configure_environment[arg]))
 
     def add_configure_vars(self, **kwargs):
         for k, v in kwargs.items():
@@ -101,7 +102,7 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
     def set_configure_prog_with_args(self, prog: str, path: Path, args: list):
         super().set_configure_prog_with_args(prog, path, args)
         if self._configure_supports_variables_on_cmdline:
-            self.configure_args.append(prog + "=" + self.configure_environment[prog])
+            self.configure_args.append("{}={}".format(prog, self.configure_environment[prog]))
 
     def setup(self):
         super().setup()
@@ -121,12 +122,15 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
     def configure(self, **kwargs):
         if self._autotools_add_default_compiler_args:
             cppflags = self.default_compiler_flags
-            for key in ("CFLAGS", "CXXFLAGS", "CPPFLAGS", "LDFLAGS"):
-                assert key not in self.configure_environment, key
+            conflicting = self.configure_environment.keys() & {"CFLAGS", "CXXFLAGS", "CPPFLAGS", "LDFLAGS"}
+            if conflicting:
+                raise ValueError("configure_environment must not set " + ", ".join(sorted(conflicting)) +
+                                 " when _autotools_add_default_compiler_args is set")
             # We have to include -target xxx-unknown-freebsd as part of CC for some build systems since they fail
             # if a plain $CC can't compile programs.
-            self.set_configure_prog_with_args("CC", self.CC, self.target_info.essential_compiler_and_linker_flags)
-            self.set_configure_prog_with_args("CXX", self.CXX, self.target_info.essential_compiler_and_linker_flags)
+            essential_flags = self.target_info.essential_compiler_and_linker_flags
+            self.set_configure_prog_with_args("CC", self.CC, essential_flags)
+            self.set_configure_prog_with_args("CXX", self.CXX, essential_flags)
             # self.add_configure_env_arg("CPPFLAGS", commandline_to_str(CPPFLAGS))
             self.add_configure_env_arg("CFLAGS", commandline_to_str(cppflags + self.CFLAGS))
             self.add_configure_env_arg("CXXFLAGS", commandline_to_str(cppflags + self.CXXFLAGS))
@@ -139,21 +143,25 @@ class CrossCompileAutotoolsProject(CrossCompileMixin, AutotoolsProject):
                     self.add_configure_env_arg("LD", self.target_info.linker)
 
         # remove all empty items from environment:
-        env = {k: v for k, v in self.configure_environment.items() if v}
-        self.configure_environment.clear()
-        self.configure_environment.update(env)
-        self.print(coloured(AnsiColour.yellow, "Cross configure environment:",
-                            pprint.pformat(self.configure_environment, width=160)))
+        for k in [k for k, v in self.configure_environment.items() if not v]:
+            del self.configure_environment[k]
+        if self.config.verbose:  # avoid the pformat() cost when not printing the environment
+            import pprint
+            self.verbose_print(coloured(AnsiColour.yellow, "Cross configure environment:",
+                                        pprint.pformat(self.configure_environment, width=160)))
         super().configure(**kwargs)
 
     def process(self):
         if not self.compiling_for_host():
             # We run all these commands with $PATH containing $CHERI_SDK/bin to ensure the right tools are used
-            with set_env(PATH=str(self.sdk_bindir) + ":" + os.getenv("PATH")):
-                super().process()
-        else:
-            # when building the native target we just rely on the host tools in /usr/bin
-            super().process()
+            sdk_bindir = str(self.sdk_bindir)
+            # If $CHERI_SDK/bin is already the first entry in $PATH there is no need to modify the environment
+            if os.getenv("PATH", "").split(":", 1)[0] != sdk_bindir:
+                with set_env(PATH=sdk_bindir + ":" + os.getenv("PATH")):
+                    super().process()
+                return
+        # when building the native target we just rely on the host tools in /usr/bin
+        super().process()
 
 
 # Sets some default values common to all FETT projects
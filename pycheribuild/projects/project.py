@@ -276,14 +276,18 @@ class SimpleProject(FileSystemUtils, metaclass=ProjectSubclassDefinitionHook):
         if _cached is not None:
             return _cached
         result = []  # type: typing.List[Target]
+        # Use a set for the membership checks to avoid quadratic complexity for targets with many dependencies
+        seen = set()  # type: typing.Set[Target]
         assert cls._xtarget is not None, cls
         for target in cls.direct_dependencies(config):
-            if target not in result:
+            if target not in seen:
+                seen.add(target)
                 result.append(target)
-            # now recursively add the other deps:
+            # now recursively add the other deps (these are cached so each subtree is only walked once):
             recursive_deps = target.project_class.recursive_dependencies(config)
             for r in recursive_deps:
-                if r not in result:
+                if r not in seen:
+                    seen.add(r)
                     result.append(r)
         cls._cached_deps = result
         return result
@@ -1505,6 +1509,8 @@ class Project(SimpleProject):
             result += target.build_suffix(config)
         return result
 
+    # Note: The result must not be memoized: it depends on the target argument (e.g. qt5 also uses it to compute the
+    # native build directory) and on per-project options such as use_asan via build_configuration_suffix().
     def build_dir_for_target(self, target: CrossCompileTarget):
         return self.config.build_root / (self.project_name.lower() + self.build_configuration_suffix(target) + "-build")
 
@@ -1712,6 +1718,14 @@ class Project(SimpleProject):
         elif cbt in (BuildType.MINSIZEREL, BuildType.MINSIZERELWITHDEBINFO):
             return ["-Os"]
 
+    # Shared between all instances, __init__ creates a copy that can be modified by subclasses
+    _default_cross_warning_flags = ("-Werror=cheri-capability-misuse", "-Werror=implicit-function-declaration",
+                                    "-Werror=format", "-Werror=undefined-internal",
+                                    "-Werror=incompatible-pointer-types",
+                                    "-Werror=cheri-prototypes", "-Werror=cheri-bitwise-operations",
+                                    # Make underaligned capability loads/stores an error and require an explicit cast:
+                                    "-Werror=pass-failed")
+
     needs_mxcaptable_static = False  # E.g. for postgres which is just over the limit:
     needs_mxcaptable_dynamic = False  # This might be true for Qt/QtWebkit
 
@@ -1734,10 +1748,16 @@ class Project(SimpleProject):
             assert not self.compiling_for_cheri()
             result.append("-fsanitize=cfi")
             result.append("-fvisibility=hidden")
+        # Note: using += instead of + avoids creating temporary lists
         if self.compiling_for_host():
-            return result + self.COMMON_FLAGS + self.compiler_warning_flags + self.optimization_flags
-        result += self.target_info.essential_compiler_and_linker_flags + self.optimization_flags
-        result += self.COMMON_FLAGS + self.compiler_warning_flags
+            result += self.COMMON_FLAGS
+            result += self.compiler_warning_flags
+            result += self.optimization_flags
+            return result
+        result += self.target_info.essential_compiler_and_linker_flags
+        result += self.optimization_flags
+        result += self.COMMON_FLAGS
+        result += self.compiler_warning_flags
         if self.config.csetbounds_stats:
             result.extend(["-mllvm", "-collect-csetbounds-output=" + str(self.csetbounds_stats_file),
                            "-mllvm", "-collect-csetbounds-stats=csv",
@@ -1777,12 +1797,13 @@ class Project(SimpleProject):
         # elif self.compiling_for_mips(include_purecap=False):
         #     emulation = "elf64btsmip_fbsd" if not self.target_info.is_baremetal() else "elf64btsmip"
         # result.append("-Wl,-m" + emulation)
+        linker = self.target_info.linker
         result += self.target_info.essential_compiler_and_linker_flags + [
-            "-fuse-ld=" + str(self.target_info.linker),
+            "-fuse-ld=" + str(linker),
             # Should no longer be needed now that I added a hack for .eh_frame
             # "-Wl,-z,notext",  # needed so that LLD allows text relocations
             ]
-        if self.should_include_debug_info and ".bfd" not in self.target_info.linker.name:
+        if self.should_include_debug_info and ".bfd" not in linker.name:
             # Add a gdb_index to massively speed up running GDB on CHERIBSD:
             result.append("-Wl,--gdb-index")
         if self.target_info.is_cheribsd() and self.config.with_libstatcounters:
@@ -1868,12 +1889,7 @@ class Project(SimpleProject):
 
         # convert the tuples into mutable lists (this is needed to avoid modifying class variables)
         # See https://github.com/CTSRD-CHERI/cheribuild/issues/33
-        self.cross_warning_flags = ["-Werror=cheri-capability-misuse", "-Werror=implicit-function-declaration",
-                                    "-Werror=format", "-Werror=undefined-internal",
-                                    "-Werror=incompatible-pointer-types",
-                                    "-Werror=cheri-prototypes", "-Werror=cheri-bitwise-operations"]
-        # Make underaligned capability loads/stores an error and require an explicit cast:
-        self.cross_warning_flags.append("-Werror=pass-failed")
+        self.cross_warning_flags = list(self._default_cross_warning_flags)
         self.host_warning_flags = []
         self.common_warning_flags = []
         target_arch = self.crosscompile_target
@@ -2139,10 +2155,10 @@ class Project(SimpleProject):
         self.configure_environment[arg] = str(value)
 
     def set_configure_prog_with_args(self, prog: str, path: Path, args: list):
-        fullpath = str(path)
         if args:
-            fullpath += " " + commandline_to_str(args)
-        self.configure_environment[prog] = fullpath
+            self.configure_environment[prog] = "{} {}".format(path, commandline_to_str(args))
+        else:
+            self.configure_environment[prog] = str(path)
 
     def configure(self, cwd: Path = None, configure_path: Path = None):
         if cwd is None:
@@ -2500,6 +2516,8 @@ class CMakeProject(Project):
     do_not_add_to_targets = True
     compile_db_requires_bear = False  # cmake -DCMAKE_EXPORT_COMPILE_COMMANDS=ON does it
     generate_cmakelists = False  # There is already a CMakeLists.txt
+    # Placeholders such as @TOOLCHAIN_SYSROOT@ in the toolchain file templates
+    _toolchain_template_placeholder_regex = re.compile(r"@(\w+)@")
 
     class Generator(Enum):
         Default = 0
@@ -2566,7 +2584,7 @@ class CMakeProject(Project):
         self.set_minimum_cmake_version(3, 7)
 
     def _prepare_toolchain_file(self, file: Path, **kwargs):
-        configured_template = self._cmake_template
+        values = dict()  # type: typing.Dict[str, str]
         for key, value in kwargs.items():
             if value is None:
                 continue
@@ -2576,11 +2594,21 @@ class CMakeProject(Project):
                 strval = commandline_to_str(value)
             else:
                 strval = str(value)
-            assert "@" + key + "@" in configured_template, key
-            configured_template = configured_template.replace("@" + key + "@", strval)
-        # work around jenkins paths that might contain @[0-9]+ in the path:
-        configured_jenkins_workaround = re.sub(r"@\d+", "", configured_template)
-        assert "@" not in configured_jenkins_workaround, configured_jenkins_workaround
+            values[key] = strval
+        # Collect all placeholders with a single scan instead of searching the template once per key
+        placeholders = set(self._toolchain_template_placeholder_regex.findall(self._cmake_template))
+        unused_values = values.keys() - placeholders
+        unset_placeholders = placeholders - values.keys()
+        if unused_values or unset_placeholders:
+            raise ValueError("Toolchain template placeholders do not match the provided values (values without a "
+                             "placeholder: " + str(sorted(unused_values)) + ", placeholders without a value: " +
+                             str(sorted(unset_placeholders)) + ")")
+        # Replace all placeholders in a single pass over the template
+        configured_template = self._toolchain_template_placeholder_regex.sub(lambda m: values[m.group(1)],
+                                                                              self._cmake_template)
+        # Check that there are no remaining @ characters (without creating another copy of the contents). Note: we have
+        # to work around jenkins paths that might contain @[0-9]+ in the path:
+        assert not re.search(r"@(?!\d)", configured_template), configured_template
         self.write_file(contents=configured_template, file=file, overwrite=True)
 
     def add_cmake_options(self, *, _include_empty_vars=False, _replace=True, **kwargs):
@@ -2664,14 +2692,16 @@ set(CMAKE_FIND_LIBRARY_CUSTOM_LIB_SUFFIX "cheri")
         else:
             self.add_cmake_options(CMAKE_INSTALL_PREFIX=self.install_dir)
         custom_ldflags = self.default_ldflags + self.LDFLAGS
+        # Note: default_compiler_flags is not cached since the flags can be modified until configure() is called
+        compiler_flags = self.default_compiler_flags
         self.add_cmake_options(
             CMAKE_C_COMPILER=self.CC,
             CMAKE_CXX_COMPILER=self.CXX,
             CMAKE_ASM_COMPILER=self.CC,  # Compile assembly files with the default compiler
             # All of these should be commandlines not CMake lists:
-            CMAKE_C_FLAGS_INIT=commandline_to_str(self.default_compiler_flags + self.CFLAGS),
-            CMAKE_CXX_FLAGS_INIT=commandline_to_str(self.default_compiler_flags + self.CXXFLAGS),
-            CMAKE_ASM_FLAGS_INIT=commandline_to_str(self.default_compiler_flags + self.ASMFLAGS),
+            CMAKE_C_FLAGS_INIT=commandline_to_str(compiler_flags + self.CFLAGS),
+            CMAKE_CXX_FLAGS_INIT=commandline_to_str(compiler_flags + self.CXXFLAGS),
+            CMAKE_ASM_FLAGS_INIT=commandline_to_str(compiler_flags + self.ASMFLAGS),
             CMAKE_EXE_LINKER_FLAGS_INIT=commandline_to_str(
                 custom_ldflags + self.target_info.additional_executable_link_flags),
             CMAKE_SHARED_LINKER_FLAGS_INIT=commandline_to_str(
@@ -31,7 +31,7 @@ import os
 import sys
 import time
 import typing
-from collections import OrderedDict
+from collections import deque, OrderedDict
 
 from .config.chericonfig import CheriConfig
 from .config.target_info import CrossCompileTarget
@@ -41,6 +41,18 @@ if typing.TYPE_CHECKING:  # no-combine
     from .projects.project import SimpleProject  # no-combine
 
 
+def _target_environment(config: CheriConfig):
+    # Only export the variables that are not already set: TargetManager.run() sets them once for all targets.
+    # Note: set_env() always restores os.environ afterwards (even if new_env is empty) so that changes made by one
+    # target (e.g. removing MAKEFLAGS in BuildFreeBSDBase) do not affect the following targets.
+    new_env = dict()
+    if os.getenv("PATH", "").split(":", 1)[0] != str(config.other_tools_dir / "bin"):
+        new_env["PATH"] = config.dollar_path_with_other_tools
+    if config.clang_colour_diags and os.getenv("CLANG_FORCE_COLOR_DIAGNOSTICS") != "always":
+        new_env["CLANG_FORCE_COLOR_DIAGNOSTICS"] = "always"
+    return set_env(**new_env)
+
+
 class Target(object):
     instantiating_targets_should_warn = True
 
@@ -49,6 +61,7 @@ class Target(object):
         self._project_class = _project_class
         self.__project = None  # type: typing.Optional[SimpleProject]
         self._completed = False
+        self._system_deps_checked = False
         self._tests_have_run = False
         self._benchmarks_have_run = False
         self._creating_project = False  # avoid cycles
@@ -75,12 +88,14 @@ class Target(object):
         return self.project_class.recursive_dependencies(config)
 
     def check_system_deps(self, config: CheriConfig):
-        if self._completed:
+        # Targets can be reached multiple times (e.g. via aliases), but we only need to check them once
+        if self._completed or self._system_deps_checked:
             return
         project = self.get_or_create_project(None, config)
-        with set_env(PATH=config.dollar_path_with_other_tools):
+        with _target_environment(config):
             # make sure all system dependencies exist first
             project.check_system_dependencies()
+        self._system_deps_checked = True
 
     def create_project(self, config: CheriConfig) -> "SimpleProject":
         assert not self._creating_project
@@ -101,10 +116,7 @@ class Target(object):
             project.setup()
         # noinspection PyProtectedMember
         assert project._setup_called, str(self._project_class) + ": forgot to call super().setup()?"
-        new_env = {"PATH": project.config.dollar_path_with_other_tools}
-        if project.config.clang_colour_diags:
-            new_env["CLANG_FORCE_COLOR_DIAGNOSTICS"] = "always"
-        with set_env(**new_env):
+        with _target_environment(project.config):
             func(project)
         status_update(msg, "for target '" + self.name + "' in", time.time() - starttime, "seconds")
 
@@ -138,6 +150,7 @@ class Target(object):
     def reset(self):
         # For unit tests to get a fresh instance
         self._completed = False
+        self._system_deps_checked = False
         self._tests_have_run = False
         self.__project = None
         self._creating_project = False
@@ -342,16 +355,18 @@ class TargetManager(object):
     @staticmethod
     def sort_in_dependency_order(targets: "typing.List[Target]") -> "typing.List[Target]":
         # pythons sorted() is guaranteed to be stable:
-        sorted_targets = list(sorted(targets))
+        sorted_targets = sorted(targets)
         # remove duplicates (insert into an orderdict to keep order
         return list(OrderedDict((x, True) for x in sorted_targets).keys())
 
     def get_all_targets(self, explicit_targets: "typing.List[Target]", config: CheriConfig) -> "typing.List[Target]":
         add_dependencies = config.include_dependencies
         chosen_targets = []  # type: typing.List[Target]
-        remaining_targets_to_check = explicit_targets
+        # Note: duplicates are not removed here since Target.__lt__ is only a partial order and removing them before
+        # sort_in_dependency_order() would change the resulting build order.
+        remaining_targets_to_check = deque(explicit_targets)
         while remaining_targets_to_check:
-            t = remaining_targets_to_check.pop(0)
+            t = remaining_targets_to_check.popleft()
             if isinstance(t, SimpleTargetAlias):
                 t = t.get_real_target(None, config)
             chosen_targets.append(t)
@@ -385,16 +400,18 @@ class TargetManager(object):
 
     def run(self, config: CheriConfig):
         chosen_targets = self.get_all_chosen_targets(config)
-
-        for target in chosen_targets:
-            target.check_system_deps(config)
-        # all dependencies exist -> run the targets
-        for target in chosen_targets:
+        # Export $PATH, etc. once for all targets instead of once for every single target
+        with _target_environment(config):
+            for target in chosen_targets:
+                target.check_system_deps(config)
+            # all dependencies exist -> run the targets
             if config.print_targets_only:
-                status_update("Will build target", coloured(AnsiColour.yellow, target.name))
-                print("    Dependencies for", target.name, "are", target.project_class.all_dependency_names(config))
+                for target in chosen_targets:
+                    status_update("Will build target", coloured(AnsiColour.yellow, target.name))
+                    print("    Dependencies for", target.name, "are", target.project_class.all_dependency_names(config))
             else:
-                target.execute(config)
+                for target in chosen_targets:
+                    target.execute(config)
 
     def get_all_chosen_targets(self, config) -> "typing.Iterable[Target]":
         # check that all target dependencies are correct:
@@ -511,6 +511,8 @@ def fatal_error(*args, sep=" ", fixit_hint=None, fatal_when_pretending=False, ex
         sys.exit(exit_code)
 
 
+# The files are part of cheribuild and don't change while we are running -> only read them once
+@functools.lru_cache(maxsize=None)
 def include_local_file(path: str) -> str:
     file = Path(__file__).parent / path  # type: Path
     if not file.is_file():
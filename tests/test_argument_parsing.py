@@ -1,4 +1,5 @@
 import inspect
+import os
 import re
 import sys
 import tempfile
@@ -12,10 +13,12 @@ import pytest
 from pycheribuild.config.loader import ConfigLoaderBase, JsonAndCommandLineConfigLoader, JsonAndCommandLineConfigOption
 
 _loader = JsonAndCommandLineConfigLoader()
-from pycheribuild.projects.project import SimpleProject
+from pycheribuild.projects.project import CMakeProject, SimpleProject
 
 SimpleProject._config_loader = _loader
 from pycheribuild.targets import target_manager, Target
+# noinspection PyProtectedMember
+from pycheribuild.targets import _target_environment
 from pycheribuild.config.defaultconfig import DefaultCheriConfig
 # noinspection PyUnresolvedReferences
 from pycheribuild.projects import *  # make sure all projects are loaded so that target_manager gets populated
@@ -24,6 +27,8 @@ from pycheribuild.projects.cross import *  # make sure all projects are loaded s
 from pycheribuild.projects.disk_image import BuildCheriBSDDiskImage, _BuildDiskImageBase
 from pycheribuild.projects.cross.qt5 import BuildQtBase
 from pycheribuild.projects.cross.cheribsd import BuildCHERIBSD, BuildFreeBSD, FreeBSDToolchainKind
+from pycheribuild.projects.cross.crosscompileproject import CrossCompileAutotoolsProject
+from pycheribuild.utils import init_global_config
 
 _targets_registered = False
 Target.instantiating_targets_should_warn = False
@@ -55,6 +60,12 @@ def _parse_arguments(args, *, config_file=Path("/this/does/not/exist")) -> Defau
     return ConfigLoaderBase._cheri_config
 
 
+def _get_project_in_pretend_mode(target_name: str, *args) -> SimpleProject:
+    config = _parse_arguments(["--pretend"] + list(args))
+    init_global_config(test_mode=True, pretend_mode=True, verbose_mode=False, quiet_mode=False)
+    return target_manager.get_target_raw(target_name).get_or_create_project(None, config)
+
+
 def _parse_config_file_and_args(config_file_contents: bytes, *args) -> DefaultCheriConfig:
     with tempfile.NamedTemporaryFile() as t:
         config = Path(t.name)
@@ -649,3 +660,95 @@ def test_default_build_dir(target: str, args: list, expected: str):
     builddir = target.get_or_create_project(None, config).build_dir
     assert isinstance(builddir, Path)
     assert builddir.name == expected
+
+
+def test_native_autotools_project_process():
+    # Native autotools projects use the host tools and must not query the SDK directory (which raises a ValueError)
+    with tempfile.TemporaryDirectory() as source_root:
+        project = _get_project_in_pretend_mode("bash-native", "--source-root", source_root)
+        assert isinstance(project, CrossCompileAutotoolsProject)
+        project.setup()
+        environ_before = dict(os.environ)
+        project.process()
+        assert dict(os.environ) == environ_before
+
+
+def test_toolchain_file_placeholders():
+    project = _get_project_in_pretend_mode("libunwind-mips-purecap")
+    assert isinstance(project, CMakeProject)
+    original_template = project._cmake_template
+    project._cmake_template = "set(FOO @FOO@)\nset(BAR \"@BAR@\")\n"
+    try:
+        toolchain_file = Path("/this/path/does/not/exist/CrossToolchain.cmake")
+        # Should not raise since all placeholders have a value:
+        project._prepare_toolchain_file(file=toolchain_file, FOO="foo", BAR=["-a", "b c"])
+        # All values must be used:
+        with pytest.raises(ValueError, match=r"without a placeholder: \['BAZ'\], placeholders without a value: \[\]"):
+            project._prepare_toolchain_file(file=toolchain_file, FOO="foo", BAR="bar", BAZ="baz")
+        # All placeholders must be set (None values are ignored):
+        with pytest.raises(ValueError, match=r"without a placeholder: \[\], placeholders without a value: \['BAR'\]"):
+            project._prepare_toolchain_file(file=toolchain_file, FOO="foo", BAR=None)
+    finally:
+        project._cmake_template = original_template
+
+
+def test_autotools_default_compiler_args_conflict():
+    project = _get_project_in_pretend_mode("bash-native")
+    assert isinstance(project, CrossCompileAutotoolsProject)
+    assert project._autotools_add_default_compiler_args
+    project.setup()
+    project.configure_environment["CFLAGS"] = "-O0"
+    with pytest.raises(ValueError, match="configure_environment must not set CFLAGS"):
+        project.configure()
+
+
+def test_system_deps_checked_once():
+    config = _parse_arguments(["--pretend"])
+    target = target_manager.get_target_raw("qemu")
+    num_checks = 0
+
+    def check_system_dependencies():
+        nonlocal num_checks
+        num_checks += 1
+
+    target.get_or_create_project(None, config).check_system_dependencies = check_system_dependencies
+    # Targets can be reached multiple times (e.g. via aliases) but the system dependencies should only be checked once
+    target.check_system_deps(config)
+    target.check_system_deps(config)
+    assert num_checks == 1
+    # reset() should ensure that they are checked again for the next run
+    target_manager.reset()
+    target.get_or_create_project(None, config).check_system_dependencies = check_system_dependencies
+    target.check_system_deps(config)
+    assert num_checks == 2
+
+
+def test_autotools_configure_env_args():
+    project = _get_project_in_pretend_mode("bash-native")
+    assert isinstance(project, CrossCompileAutotoolsProject)
+    assert project._configure_supports_variables_on_cmdline
+    project.configure_args.clear()
+    project.add_configure_env_arg("FOO", Path("/foo/bar"))
+    # None values should be ignored (and not be passed as FOO=None)
+    project.add_configure_env_arg("BAR", None)
+    project.set_configure_prog_with_args("CC", Path("/path/to/cc"), ["-target", "foo bar"])
+    project.set_configure_prog_with_args("CXX", Path("/path/to/c++"), [])
+    assert project.configure_args == ["FOO=/foo/bar", "CC=/path/to/cc -target 'foo bar'", "CXX=/path/to/c++"]
+    assert "BAR" not in project.configure_environment
+    assert project.configure_environment["CC"] == "/path/to/cc -target 'foo bar'"
+
+
+def test_target_environment_restored():
+    # Changes to os.environ made by one target (e.g. BuildFreeBSDBase removing MAKEFLAGS) must not leak into later ones
+    config = _parse_arguments(["--pretend"])
+    target = target_manager.get_target_raw("bash-native")
+    environ_before = dict(os.environ)
+    os.environ["MAKEFLAGS"] = "-j4"
+    try:
+        # TargetManager.run() has already exported $PATH, etc. so _do_run() does not need to set any variables
+        with _target_environment(config):
+            target._do_run(config, msg="Ran test function", func=lambda project: os.environ.pop("MAKEFLAGS"))
+            assert os.environ.get("MAKEFLAGS") == "-j4"
+    finally:
+        os.environ.clear()
+        os.environ.update(environ_before)
@@ -189,6 +189,17 @@ def test_riscv():
         "qemu", "llvm-native", "cheribsd-riscv64", "gdb-riscv64", "disk-image-riscv64", "run-riscv64"]
 
 
+def test_duplicate_dependencies_order():
+    # Many of the FETT targets share dependencies. Since Target.__lt__ is only a partial order, the final order depends
+    # on all the duplicates that were added in get_all_targets(). Check that it does not change unexpectedly.
+    assert _sort_targets(["run-fett-riscv64-purecap"], add_dependencies=True, skip_sdk=False) == [
+        "qemu", "llvm-native", "cheribsd-riscv64-hybrid", "fett-openssl-riscv64-purecap", "fett-zlib-riscv64-purecap",
+        "fett-kcgi-riscv64-purecap", "fett-sqlite-riscv64-purecap", "fett-sqlbox-riscv64-purecap", "openradtool",
+        "bash-riscv64-purecap", "fett-nginx-riscv64-purecap", "fett-openssh-riscv64-purecap",
+        "fett-voting-riscv64-purecap", "fett-config-riscv64-purecap", "bbl-baremetal-riscv64-purecap",
+        "disk-image-fett-riscv64-purecap", "run-fett-riscv64-purecap"]
+
+
 # Check that libcxx deps with skip sdk pick the matching -native/-mips versions
 # Also the libcxx target should resolve to libcxx-mips-purecap:
 @pytest.mark.parametrize("suffix,expected_suffix", [